@@ -1,10 +1,12 @@
 """
 Core data models for the Arbitrage Agent.
 """
-from pydantic import BaseModel, Field
-from typing import Optional, List
+import uuid
+from pydantic import BaseModel, Field, model_validator
+from typing import Optional, List, Deque
 from datetime import datetime
 from enum import Enum
+from collections import deque
 
 
 class AssetType(str, Enum):
@@ -23,6 +25,21 @@ class MarketData(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     source: str = "robinhood"
 
+    @classmethod
+    def from_robinhood_quote(cls, quote: dict, symbol: str, asset_type: AssetType = AssetType.CRYPTO,
+                             source: str = "robinhood_live_official") -> "MarketData":
+        """Build from a raw best_bid_ask result. Fields are float()-parsed here, so validation is skipped."""
+        price = float(quote.get("price", 0))
+        return cls.model_construct(
+            symbol=symbol,
+            asset_type=asset_type,
+            price=price,
+            bid=float(quote.get("bid_inclusive_of_fee", price)),
+            ask=float(quote.get("ask_inclusive_of_fee", price)),
+            volume=float(quote["volume"]) if quote.get("volume") else None,
+            source=source,
+        )
+
 
 class SentimentData(BaseModel):
     """Sentiment analysis from news/web sources."""
@@ -46,7 +63,7 @@ class VisualPattern(BaseModel):
 
 class ArbitrageOpportunity(BaseModel):
     """A detected arbitrage opportunity."""
-    id: str = Field(default_factory=lambda: datetime.utcnow().strftime("%Y%m%d%H%M%S"))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     buy_asset: str
     sell_asset: str
     buy_price: float
@@ -58,14 +75,20 @@ class ArbitrageOpportunity(BaseModel):
     neo4j_correlations: List[str] = []
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     status: str = "detected"
+    is_actionable: bool = False
+    is_anomaly: bool = False
 
-    @property
-    def is_actionable(self) -> bool:
-        return self.predicted_score >= 0.75
+    @model_validator(mode="after")
+    def _set_flags(self) -> "ArbitrageOpportunity":
+        """Compute the score-derived flags once instead of on every access."""
+        self.is_actionable = self.predicted_score >= 0.75
+        self.is_anomaly = self.predicted_score >= 0.95 or abs(self.spread_pct) > 5.0
+        return self
 
-    @property
-    def is_anomaly(self) -> bool:
-        return self.predicted_score >= 0.95 or abs(self.spread_pct) > 5.0
+    @classmethod
+    def model_construct(cls, _fields_set=None, **values) -> "ArbitrageOpportunity":
+        # Validators don't run on model_construct, so set the flags here too
+        return super().model_construct(_fields_set, **values)._set_flags()
 
 
 class TradeAction(str, Enum):
@@ -110,6 +133,6 @@ class AgentState(BaseModel):
     total_pnl: float = 0.0
     is_running: bool = False
     active_opportunities: List[ArbitrageOpportunity] = []
-    recent_trades: List[TradeResult] = []
+    recent_trades: Deque[TradeResult] = Field(default_factory=lambda: deque(maxlen=10))
     errors: List[str] = []
     integration_status: dict = {}
@@ -9,13 +9,19 @@ Core Agent Orchestrator — The autonomous loop that runs the 5-step workflow:
 import asyncio
 import logging
 import random
+import time
+from collections import deque
+from itertools import islice
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Set
 
-from app.config import settings
+import orjson
+
+from app.config import get_settings
 from app.agent.models import (
     AgentState, ArbitrageOpportunity, TradeResult, TradeAction, PnLRecord
 )
+from app.integrations.base import BaseIntegration
 from app.integrations.robinhood import RobinhoodClient
 from app.integrations.senso import SensoClient
 from app.integrations.airbyte import AirbyteClient
@@ -29,6 +35,27 @@ from app.integrations.modulate import ModulateClient
 
 logger = logging.getLogger(__name__)
 
+_BANNER = "=" * 60
+
+
+class SubscriberQueue:
+    """Bounded per-subscriber outbox. A slow reader loses its oldest snapshots rather than
+    stalling the publisher — dashboard state is superseded by every newer frame anyway."""
+
+    def __init__(self, maxlen: int = 8):
+        self._frames: deque = deque(maxlen=maxlen)
+        self._ready = asyncio.Event()
+
+    def put(self, frame: bytes) -> None:
+        self._frames.append(frame)  # drops the oldest frame when full
+        self._ready.set()
+
+    async def get(self) -> bytes:
+        while not self._frames:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._frames.popleft()
+
 
 class AgentOrchestrator:
     """
@@ -37,25 +64,43 @@ class AgentOrchestrator:
     """
 
     def __init__(self):
+        settings = get_settings()
         self.state = AgentState()
         self._running = False
         self._task: Optional[asyncio.Task] = None
-        self._cycle_logs: list = []
+        self._cycle_logs: deque = deque(maxlen=50)
+        self._state_cache: Optional[bytes] = None  # serialized get_state(), cleared on mutation
+        self._subscribers: Set[SubscriberQueue] = set()  # dashboard push streams
+        self._rng = random.Random()  # dedicated instance for simulated quantities/P&L
+
+        # Watchlist
+        self.crypto_watchlist = ("BTC", "ETH", "SOL", "DOGE")
+        self.stock_watchlist = ("AAPL", "TSLA", "NVDA", "SPY", "DJT")
+
+        # Cap in-flight requests per remote host so fan-out doesn't trip rate limits
+        self._host_semaphores = {
+            name: asyncio.Semaphore(limit) for name, limit in (
+                ("robinhood", settings.robinhood_max_concurrency), ("tavily", 10),
+            )
+        }
 
         # Initialize all integrations
         self.robinhood = RobinhoodClient(
             api_key=settings.robinhood_api_key,
             private_key=settings.robinhood_private_key,
+            semaphore=self._host_semaphores["robinhood"],
+            watchlist=self.crypto_watchlist,
         )
         self.senso = SensoClient(api_key=settings.senso_api_key, base_url=settings.senso_base_url)
         self.airbyte = AirbyteClient(
             api_key=settings.airbyte_api_key, base_url=settings.airbyte_base_url,
             workspace_id=settings.airbyte_workspace_id,
         )
-        self.tavily = TavilyClient(api_key=settings.tavily_api_key)
+        self.tavily = TavilyClient(api_key=settings.tavily_api_key, semaphore=self._host_semaphores["tavily"])
         self.reka = RekaClient(api_key=settings.reka_api_key, base_url=settings.reka_base_url)
         self.neo4j = Neo4jClient(
             uri=settings.neo4j_uri, username=settings.neo4j_username, password=settings.neo4j_password,
+            warmup_on_start=settings.neo4j_warmup_on_start,
         )
         self.fastino = FastinoClient(api_key=settings.fastino_api_key, base_url=settings.fastino_base_url)
         self.yutori = YutoriClient(api_key=settings.yutori_api_key, base_url=settings.yutori_base_url)
@@ -67,24 +112,23 @@ class AgentOrchestrator:
             self.neo4j, self.fastino, self.yutori, self.numeric, self.modulate,
         ]
 
-        # Watchlist
-        self.crypto_watchlist = ["BTC", "ETH", "SOL", "DOGE"]
-        self.stock_watchlist = ["AAPL", "TSLA", "NVDA", "SPY", "DJT"]
-
     async def initialize(self) -> dict:
         """Initialize all integrations and return status."""
         logger.info("🚀 Initializing Autonomous Arbitrage Agent...")
         results = {}
-        for integration in self._integrations:
-            try:
-                success = await integration.initialize()
-                results[integration.name] = {"status": "ok" if success else "degraded", "ready": integration.is_ready}
-                logger.info(f"  {'✅' if success else '⚠️'} {integration.name}")
-            except Exception as e:
-                results[integration.name] = {"status": "error", "error": str(e)}
-                logger.error(f"  ❌ {integration.name}: {e}")
+        outcomes = await asyncio.gather(
+            *(i.initialize() for i in self._integrations), return_exceptions=True,
+        )
+        for integration, outcome in zip(self._integrations, outcomes):
+            if isinstance(outcome, Exception):
+                results[integration.name] = {"status": "error", "error": str(outcome)}
+                logger.error("  ❌ %s: %s", integration.name, outcome)
+            else:
+                results[integration.name] = {"status": "ok" if outcome else "degraded", "ready": integration.is_ready}
+                logger.info("  %s %s", "✅" if outcome else "⚠️", integration.name)
 
         self.state.integration_status = results
+        self._state_cache = None
         await self.senso.update_context("integrations", results)
         logger.info("🤖 Agent initialization complete")
         return results
@@ -96,44 +140,61 @@ class AgentOrchestrator:
             return
         self._running = True
         self.state.is_running = True
+        self._state_cache = None
         self._task = asyncio.create_task(self._run_loop())
+        # Live quote prefetching only pays off while cycles are consuming the quotes
+        self.robinhood.start_prefetch()
+        await self._publish_state()
         logger.info("▶️ Agent loop started")
 
     async def stop(self) -> None:
         """Stop the autonomous agent loop."""
         self._running = False
         self.state.is_running = False
+        self._state_cache = None
+        await self.robinhood.stop_prefetch()
         if self._task:
             self._task.cancel()
             try:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        await self._publish_state()
         logger.info("⏹️ Agent loop stopped")
 
+    async def shutdown(self) -> None:
+        """Stop the loop and release every integration's resources."""
+        await self.stop()
+        await asyncio.gather(*(i.shutdown() for i in self._integrations), return_exceptions=True)
+
     async def _run_loop(self) -> None:
         """Main autonomous loop."""
         while self._running:
             try:
                 await self._run_cycle()
-                await asyncio.sleep(settings.agent_cycle_interval_seconds)
+                await asyncio.sleep(get_settings().agent_cycle_interval_seconds)
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Cycle error: {e}")
+                logger.error("Cycle error: %s", e)
                 self.state.errors.append(f"{datetime.utcnow().isoformat()}: {e}")
+                self._state_cache = None
                 await asyncio.sleep(5)
 
     async def _run_cycle(self) -> dict:
         """Execute one full agent cycle (Ingest → Analyze → Predict → Execute → Learn)."""
-        cycle_start = datetime.utcnow()
+        t0 = time.perf_counter()
+        now = datetime.utcnow()  # shared timestamp for models built this cycle
+        started_at = now.isoformat()
         self.state.cycle_count += 1
+        self._state_cache = None
         cycle_id = self.state.cycle_count
-        log = {"cycle": cycle_id, "started_at": cycle_start.isoformat(), "steps": {}}
+        log = {"cycle": cycle_id, "started_at": started_at, "steps": {}}
 
-        logger.info(f"\n{'='*60}")
-        logger.info(f"🔄 CYCLE #{cycle_id} starting at {cycle_start.isoformat()}")
-        logger.info(f"{'='*60}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n%s", _BANNER)
+            logger.info("🔄 CYCLE #%d starting at %s", cycle_id, started_at)
+            logger.info(_BANNER)
 
         await self.senso.set_workflow_state("ingesting")
 
@@ -141,24 +202,15 @@ class AgentOrchestrator:
         logger.info("📥 Step 1: INGEST — Fetching market data...")
         nav_plan = await self.yutori.get_navigation_plan("ingest")
 
-        # Fetch crypto quotes
-        crypto_data = {}
-        for symbol in self.crypto_watchlist:
-            crypto_data[symbol] = await self.robinhood.get_crypto_quote(symbol)
-
-        # Fetch stock quotes
-        stock_data = {}
-        for symbol in self.stock_watchlist:
-            stock_data[symbol] = await self.robinhood.get_stock_quote(symbol)
-
-        # Fetch economic indicators
-        economic_data = await self.airbyte.get_latest_records("economic_indicators")
-
-        # Fetch sentiment
-        sentiment = await self.tavily.get_sentiment("crypto market momentum")
-        trending = await self.tavily.get_trending_news("crypto")
-
-        portfolio = await self.robinhood.get_portfolio()
+        # Fan out quotes, economic indicators, sentiment and portfolio concurrently
+        crypto_data, stock_data, economic_data, sentiment, trending, portfolio = await asyncio.gather(
+            self.robinhood.get_crypto_quotes(self.crypto_watchlist),
+            self.robinhood.get_stock_quotes(self.stock_watchlist),
+            self.airbyte.get_latest_records("economic_indicators"),
+            self.tavily.get_sentiment("crypto market momentum"),
+            self.tavily.get_trending_news("crypto"),
+            self.robinhood.get_portfolio(),
+        )
 
         log["steps"]["ingest"] = {
             "crypto_quotes": len(crypto_data),
@@ -166,64 +218,81 @@ class AgentOrchestrator:
             "economic_indicators": len(economic_data),
             "sentiment_score": sentiment.sentiment_score,
         }
-        logger.info(f"  📊 {len(crypto_data)} crypto, {len(stock_data)} stock quotes fetched")
-        logger.info(f"  📰 Sentiment: {sentiment.sentiment_score:.2f} | {len(trending)} trending news")
+        logger.info("  📊 %d crypto, %d stock quotes fetched", len(crypto_data), len(stock_data))
+        logger.info("  📰 Sentiment: %.2f | %d trending news", sentiment.sentiment_score, len(trending))
 
         # ── STEP 2: ANALYZE ─────────────────────────────────
         await self.senso.set_workflow_state("analyzing")
         logger.info("🔍 Step 2: ANALYZE — Finding patterns & correlations...")
 
-        # Analyze charts with Reka Vision
-        chart_patterns = []
-        for symbol in self.crypto_watchlist[:2]:
-            pattern = await self.reka.analyze_chart(symbol, "4h")
-            chart_patterns.append(pattern)
-            await self.yutori.route_data("visual_pattern", pattern.model_dump())
-
-        # Find historical correlations in Neo4j
-        correlations = await self.neo4j.find_correlations("market_move", self.crypto_watchlist[0])
+        # Analyze charts with Reka Vision and find historical correlations in Neo4j
+        chart_patterns, correlations = await asyncio.gather(
+            asyncio.gather(*(self.reka.analyze_chart(s, "4h") for s in self.crypto_watchlist[:2])),
+            self.neo4j.find_correlations("market_move", self.crypto_watchlist[0]),
+        )
+        chart_patterns = list(chart_patterns)
 
-        # Store events in knowledge graph
-        for symbol, data in crypto_data.items():
-            await self.neo4j.store_event("price_snapshot", data.model_dump())
+        # Route patterns and store price snapshots in the knowledge graph
+        await asyncio.gather(
+            *(self.yutori.route_data("visual_pattern", p.model_dump()) for p in chart_patterns),
+            self.neo4j.store_events_batch("price_snapshot", [d.model_dump() for d in crypto_data.values()]),
+        )
 
         log["steps"]["analyze"] = {
             "patterns_detected": len(chart_patterns),
             "correlations_found": len(correlations),
         }
-        logger.info(f"  🎯 {len(chart_patterns)} visual patterns, {len(correlations)} correlations")
+        logger.info("  🎯 %d visual patterns, %d correlations", len(chart_patterns), len(correlations))
 
         # ── STEP 3: PREDICT ─────────────────────────────────
         await self.senso.set_workflow_state("predicting")
         logger.info("🧠 Step 3: PREDICT — Scoring arbitrage opportunities...")
 
-        opportunities = []
         # Detect cross-exchange spread opportunities (simulated)
+        candidates = []
         for symbol in self.crypto_watchlist:
             data = crypto_data[symbol]
             if data.bid and data.ask:
                 spread_pct = ((data.ask - data.bid) / data.bid) * 100
                 if spread_pct > 0.05:  # Any meaningful spread
-                    opp_data = {
+                    candidates.append((symbol, data, spread_pct))
+
+        # Cycle-constant inputs shared by every candidate
+        correlation_events = [c["event"] for c in correlations]
+        pattern_dumps = [p.model_dump() for p in chart_patterns]
+
+        # Score every candidate in one model call
+        scores = []
+        if candidates:
+            scores = await self.fastino.predict_opportunity_batch(
+                [
+                    {
                         "spread_pct": spread_pct,
                         "sentiment_score": sentiment.sentiment_score,
                         "correlations": correlations,
-                        "patterns": [p.model_dump() for p in chart_patterns],
+                        "patterns": pattern_dumps,
                     }
-                    score = await self.fastino.predict_opportunity(opp_data, await self.senso.get_context())
-
-                    opp = ArbitrageOpportunity(
-                        buy_asset=f"{symbol}/Exchange-A",
-                        sell_asset=f"{symbol}/Exchange-B",
-                        buy_price=data.bid,
-                        sell_price=data.ask,
-                        spread_pct=spread_pct,
-                        predicted_score=score,
-                        sentiment_score=sentiment.sentiment_score,
-                        visual_patterns=chart_patterns,
-                        neo4j_correlations=[c["event"] for c in correlations],
-                    )
-                    opportunities.append(opp)
+                    for _, _, spread_pct in candidates
+                ],
+                await self.senso.get_context(),
+            )
+
+        # Inputs are already-validated quotes/scores, so model_construct skips re-validation
+        opportunities = [
+            ArbitrageOpportunity.model_construct(
+                buy_asset=f"{symbol}/Exchange-A",
+                sell_asset=f"{symbol}/Exchange-B",
+                buy_price=data.bid,
+                sell_price=data.ask,
+                spread_pct=spread_pct,
+                predicted_score=score,
+                sentiment_score=sentiment.sentiment_score,
+                visual_patterns=chart_patterns,
+                neo4j_correlations=correlation_events,
+                timestamp=now,
+            )
+            for (symbol, data, spread_pct), score in zip(candidates, scores)
+        ]
 
         # Sort by score
         opportunities.sort(key=lambda o: o.predicted_score, reverse=True)
@@ -235,17 +304,20 @@ class AgentOrchestrator:
             top_opp = opportunities[0]
             decision = await self.yutori.make_decision({"predicted_score": top_opp.predicted_score})
 
-        await self.senso.update_context("last_opportunities", len(opportunities))
-        await self.senso.update_context("top_score", top_opp.predicted_score if top_opp else 0)
+        await self.senso.update_many({
+            "last_opportunities": len(opportunities),
+            "top_score": top_opp.predicted_score if top_opp else 0,
+        })
 
         log["steps"]["predict"] = {
             "opportunities_found": len(opportunities),
             "top_score": top_opp.predicted_score if top_opp else 0,
             "decision": decision,
         }
-        logger.info(f"  💡 {len(opportunities)} opportunities found")
+        logger.info("  💡 %d opportunities found", len(opportunities))
         if top_opp:
-            logger.info(f"  🏆 Top: {top_opp.buy_asset} | Score: {top_opp.predicted_score:.4f} | Decision: {decision['action']}")
+            logger.info("  🏆 Top: %s | Score: %.4f | Decision: %s",
+                        top_opp.buy_asset, top_opp.predicted_score, decision["action"])
 
         # ── STEP 4: EXECUTE ─────────────────────────────────
         await self.senso.set_workflow_state("executing")
@@ -253,18 +325,21 @@ class AgentOrchestrator:
 
         trade = None
         if top_opp and decision["action"] in ("execute", "execute_and_alert"):
-            trade = TradeResult(
+            trade = TradeResult.model_construct(
                 opportunity_id=top_opp.id,
                 action=TradeAction.BUY,
                 asset=top_opp.buy_asset.split("/")[0],
-                quantity=round(random.uniform(0.01, 0.1), 4),
+                quantity=round(self._rng.uniform(0.01, 0.1), 4),
                 price=top_opp.buy_price,
                 simulated=True,
+                executed_at=now,
                 notes=f"Score: {top_opp.predicted_score:.4f} | {decision['reason']}",
             )
             self.state.trades_executed += 1
-            self.state.recent_trades = [trade] + self.state.recent_trades[:9]
-            logger.info(f"  💰 SIMULATED TRADE: {trade.action.value} {trade.quantity} {trade.asset} @ ${trade.price:,.2f}")
+            self.state.recent_trades.appendleft(trade)
+            self._state_cache = None
+            logger.info("  💰 SIMULATED TRADE: %s %s %s @ $%.2f",
+                        trade.action.value, trade.quantity, trade.asset, trade.price)
 
             # Emergency voice alert for anomalies
             if decision["action"] == "execute_and_alert" or (top_opp and top_opp.is_anomaly):
@@ -292,8 +367,8 @@ class AgentOrchestrator:
             await self.numeric.log_trade(trade)
 
             # Simulate P&L (mock — in production this would be real)
-            mock_pnl = round(random.uniform(-50, 150), 2)
-            pnl_record = PnLRecord(
+            mock_pnl = round(self._rng.uniform(-50, 150), 2)
+            pnl_record = PnLRecord.model_construct(
                 trade_id=trade.order_id or f"sim-{self.state.cycle_count}",
                 opportunity_id=trade.opportunity_id,
                 entry_price=trade.price,
@@ -302,6 +377,7 @@ class AgentOrchestrator:
                 pnl=mock_pnl,
                 pnl_pct=round((mock_pnl / (trade.price * trade.quantity)) * 100, 2),
                 asset=trade.asset,
+                recorded_at=now,
             )
             await self.numeric.record_pnl(pnl_record)
             self.state.total_pnl += mock_pnl
@@ -312,7 +388,7 @@ class AgentOrchestrator:
                 pnl=mock_pnl,
                 success=mock_pnl > 0,
             )
-            logger.info(f"  📈 P&L: ${mock_pnl:+.2f} | Total: ${self.state.total_pnl:+.2f}")
+            logger.info("  📈 P&L: $%+.2f | Total: $%+.2f", mock_pnl, self.state.total_pnl)
 
         log["steps"]["learn"] = {
             "pnl_updated": trade is not None,
@@ -320,19 +396,20 @@ class AgentOrchestrator:
         }
 
         # ── CYCLE COMPLETE ──────────────────────────────────
-        self.state.last_cycle_at = datetime.utcnow()
+        end_dt = datetime.utcnow()
+        self.state.last_cycle_at = end_dt
         self.state.opportunities_detected += len(opportunities)
         self.state.active_opportunities = opportunities[:5]
         await self.senso.set_workflow_state("idle")
+        self._state_cache = orjson.dumps(self.get_state())
+        await self._publish_state()
 
-        log["completed_at"] = datetime.utcnow().isoformat()
-        log["duration_seconds"] = (datetime.utcnow() - cycle_start).total_seconds()
+        log["completed_at"] = end_dt.isoformat()
+        log["duration_seconds"] = time.perf_counter() - t0
         self._cycle_logs.append(log)
-        if len(self._cycle_logs) > 50:
-            self._cycle_logs = self._cycle_logs[-50:]
 
-        logger.info(f"✅ Cycle #{cycle_id} complete in {log['duration_seconds']:.1f}s")
-        logger.info(f"   Total: {self.state.trades_executed} trades | ${self.state.total_pnl:+.2f} P&L")
+        logger.info("✅ Cycle #%d complete in %.1fs", cycle_id, log["duration_seconds"])
+        logger.info("   Total: %d trades | $%+.2f P&L", self.state.trades_executed, self.state.total_pnl)
 
         return log
 
@@ -349,16 +426,42 @@ class AgentOrchestrator:
             "active_opportunities": [o.model_dump() for o in self.state.active_opportunities],
         }
 
+    def get_state_json(self) -> bytes:
+        """Get current agent state as JSON bytes, reusing the cached encoding when unchanged."""
+        if self._state_cache is None:
+            self._state_cache = orjson.dumps(self.get_state())
+        return self._state_cache
+
+    def subscribe(self) -> SubscriberQueue:
+        """Register a state stream; the queue receives encoded state after every change."""
+        queue = SubscriberQueue()
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: SubscriberQueue) -> None:
+        self._subscribers.discard(queue)
+
+    async def _publish_state(self) -> None:
+        """Push the current state to every subscriber, encoded once.
+
+        Each subscriber's socket is written by its own task, so this only enqueues; it still
+        yields between batches so a large fan-out can't hold the loop away from HTTP handlers.
+        """
+        if not self._subscribers:
+            return
+        payload = self.get_state_json()
+        subscribers = list(self._subscribers)
+        for i in range(0, len(subscribers), 50):
+            for queue in subscribers[i:i + 50]:
+                queue.put(payload)
+            await asyncio.sleep(0)
+
     def get_cycle_logs(self, limit: int = 10) -> list:
-        """Get recent cycle logs."""
-        return self._cycle_logs[-limit:]
+        """Get recent cycle logs (limit=0 returns all of them)."""
+        if limit <= 0:
+            return list(self._cycle_logs)[-limit:]
+        return list(islice(self._cycle_logs, max(0, len(self._cycle_logs) - limit), None))
 
     async def get_integration_health(self) -> dict:
         """Check health of all integrations."""
-        health = {}
-        for integration in self._integrations:
-            try:
-                health[integration.name] = await integration.health_check()
-            except Exception as e:
-                health[integration.name] = {"status": "error", "error": str(e)}
-        return health
+        return await BaseIntegration.gather_health(self._integrations)
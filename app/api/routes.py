@@ -1,16 +1,77 @@
 """
 API Routes — Health, status, and agent control endpoints.
 """
-from fastapi import APIRouter, HTTPException
+import asyncio
+import functools
+import time
+from typing import Optional
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
 
+from app.agent.orchestrator import AgentOrchestrator
+
 router = APIRouter()
-_orchestrator = None
 
 
-def set_orchestrator(orchestrator):
-    global _orchestrator
-    _orchestrator = orchestrator
+def _ready_orchestrator(app) -> Optional[AgentOrchestrator]:
+    """The app's orchestrator once it has finished warming up, else None."""
+    ready = getattr(app.state, "ready", None)
+    if ready is None or not ready.is_set():
+        return None
+    return app.state.orchestrator
+
+
+def get_orchestrator(request: Request) -> AgentOrchestrator:
+    """The app's orchestrator, bound to app.state by the lifespan."""
+    orchestrator = _ready_orchestrator(request.app)
+    if orchestrator is None:
+        raise HTTPException(status_code=503, detail="Agent not initialized")
+    return orchestrator
+
+
+def ttl_json(seconds: float):
+    """Memoize an async function's result as encoded JSON bytes for `seconds`.
+
+    Refills are single-flight: concurrent callers on an expired entry wait for one computation.
+    """
+    def decorator(fn):
+        cache: dict = {}
+        locks: dict = {}
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs) -> bytes:
+            key = (args, tuple(sorted(kwargs.items())))
+            hit = cache.get(key)
+            if hit is None or time.monotonic() - hit[0] >= seconds:
+                async with locks.setdefault(key, asyncio.Lock()):
+                    hit = cache.get(key)
+                    if hit is None or time.monotonic() - hit[0] >= seconds:
+                        body = orjson.dumps(await fn(*args, **kwargs))
+                        hit = cache[key] = (time.monotonic(), body)
+            return hit[1]
+        return wrapper
+    return decorator
+
+
+def ttl_cache(seconds: float):
+    """Serve a polled GET endpoint's encoded JSON body from memory for `seconds`."""
+    def decorator(fn):
+        cached = ttl_json(seconds)(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            return Response(content=await cached(*args, **kwargs), media_type="application/json")
+        return wrapper
+    return decorator
+
+
+@ttl_json(5)
+async def _integration_health_json(orchestrator: AgentOrchestrator):
+    """Integration health shared by /integrations and /dashboard; one sweep per 5s."""
+    return await orchestrator.get_integration_health()
 
 
 @router.get("/health")
@@ -18,18 +79,55 @@ async def health_check():
     return {"status": "healthy", "service": "arbitrage-agent", "version": "0.1.0"}
 
 
-@router.get("/status")
-async def agent_status():
-    if not _orchestrator:
+@router.get("/status", response_model=None)
+async def agent_status(request: Request):
+    orchestrator = _ready_orchestrator(request.app)
+    if orchestrator is None:
         return {"status": "not_initialized"}
-    return _orchestrator.get_state()
-
-
-@router.get("/integrations")
-async def integration_health():
-    if not _orchestrator:
-        raise HTTPException(status_code=503, detail="Agent not initialized")
-    return await _orchestrator.get_integration_health()
+    return Response(content=orchestrator.get_state_json(), media_type="application/json")
+
+
+@router.get("/dashboard", response_model=None)
+async def dashboard_state(orchestrator: AgentOrchestrator = Depends(get_orchestrator)):
+    """Status and integration health in one response, for a single dashboard refresh."""
+    health = await _integration_health_json(orchestrator)
+    # Splice in the cached state encoding rather than re-encoding it
+    body = b"".join((b'{"status":', orchestrator.get_state_json(), b',"integrations":', health, b"}"))
+    return Response(content=body, media_type="application/json")
+
+
+@router.websocket("/ws/dashboard")
+async def dashboard_stream(ws: WebSocket):
+    """Push agent state to the dashboard on every change (replaces status polling)."""
+    orchestrator = _ready_orchestrator(ws.app)
+    if orchestrator is None:
+        # Reject the handshake while warming up (the client never sees onopen) and let it retry
+        await ws.close(code=1013)
+        return
+    await ws.accept()
+    queue = orchestrator.subscribe()
+
+    async def pump():
+        await ws.send_bytes(orchestrator.get_state_json())
+        while True:
+            await ws.send_bytes(await queue.get())
+
+    sender = asyncio.create_task(pump())
+    try:
+        # Read until the client goes away so the subscription is dropped promptly
+        while (await ws.receive())["type"] != "websocket.disconnect":
+            pass
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        orchestrator.unsubscribe(queue)
+        sender.cancel()
+        await asyncio.gather(sender, return_exceptions=True)
+
+
+@router.get("/integrations", response_model=None)
+async def integration_health(orchestrator: AgentOrchestrator = Depends(get_orchestrator)):
+    return Response(content=await _integration_health_json(orchestrator), media_type="application/json")
 
 
 class RobinhoodLoginRequest(BaseModel):
@@ -37,87 +135,68 @@ class RobinhoodLoginRequest(BaseModel):
     private_key: str
 
 @router.post("/integrations/robinhood/login")
-async def robinhood_login(req: RobinhoodLoginRequest):
-    if not _orchestrator:
-        raise HTTPException(status_code=503, detail="Agent not initialized")
-    success = await _orchestrator.robinhood.update_credentials(req.api_key, req.private_key)
+async def robinhood_login(req: RobinhoodLoginRequest, orchestrator: AgentOrchestrator = Depends(get_orchestrator)):
+    success = await orchestrator.robinhood.update_credentials(req.api_key, req.private_key)
     if success:
         return {"status": "success", "message": "Robinhood authenticated"}
     else:
         raise HTTPException(status_code=401, detail="Authentication failed (check keys)")
 
 
-@router.get("/portfolio")
-async def portfolio():
-    if not _orchestrator:
-        raise HTTPException(status_code=503, detail="Agent not initialized")
-    return await _orchestrator.robinhood.get_portfolio()
+@router.get("/portfolio", response_model=None)
+@ttl_cache(2)
+async def portfolio(orchestrator: AgentOrchestrator = Depends(get_orchestrator)):
+    return await orchestrator.robinhood.get_portfolio()
 
 
 @router.get("/quotes/{asset_type}/{symbol}")
-async def get_quote(asset_type: str, symbol: str):
-    if not _orchestrator:
-        raise HTTPException(status_code=503, detail="Agent not initialized")
+async def get_quote(asset_type: str, symbol: str, orchestrator: AgentOrchestrator = Depends(get_orchestrator)):
     if asset_type == "crypto":
-        return (await _orchestrator.robinhood.get_crypto_quote(symbol)).model_dump()
+        return (await orchestrator.robinhood.get_crypto_quote(symbol)).model_dump()
     elif asset_type == "stock":
-        return (await _orchestrator.robinhood.get_stock_quote(symbol)).model_dump()
+        return (await orchestrator.robinhood.get_stock_quote(symbol)).model_dump()
     raise HTTPException(status_code=400, detail="asset_type must be 'crypto' or 'stock'")
 
 
 @router.post("/agent/start")
-async def start_agent():
-    if not _orchestrator:
-        raise HTTPException(status_code=503, detail="Agent not initialized")
-    await _orchestrator.start()
+async def start_agent(orchestrator: AgentOrchestrator = Depends(get_orchestrator)):
+    await orchestrator.start()
     return {"status": "started"}
 
 
 @router.post("/agent/stop")
-async def stop_agent():
-    if not _orchestrator:
-        raise HTTPException(status_code=503, detail="Agent not initialized")
-    await _orchestrator.stop()
+async def stop_agent(orchestrator: AgentOrchestrator = Depends(get_orchestrator)):
+    await orchestrator.stop()
     return {"status": "stopped"}
 
 
 @router.post("/agent/cycle")
-async def trigger_cycle():
-    if not _orchestrator:
-        raise HTTPException(status_code=503, detail="Agent not initialized")
-    return await _orchestrator.run_single_cycle()
+async def trigger_cycle(orchestrator: AgentOrchestrator = Depends(get_orchestrator)):
+    return await orchestrator.run_single_cycle()
 
 
-@router.get("/cycles")
-async def get_cycles(limit: int = 10):
-    if not _orchestrator:
-        raise HTTPException(status_code=503, detail="Agent not initialized")
-    return _orchestrator.get_cycle_logs(limit)
+@router.get("/cycles", response_model=None)
+async def get_cycles(limit: int = 10, orchestrator: AgentOrchestrator = Depends(get_orchestrator)):
+    return ORJSONResponse(content=orchestrator.get_cycle_logs(limit))
 
 
 @router.get("/pnl")
-async def get_pnl():
-    if not _orchestrator:
-        raise HTTPException(status_code=503, detail="Agent not initialized")
-    return await _orchestrator.numeric.get_pnl()
+async def get_pnl(orchestrator: AgentOrchestrator = Depends(get_orchestrator)):
+    return await orchestrator.numeric.get_pnl()
 
 
-@router.get("/graph/stats")
-async def graph_stats():
-    if not _orchestrator:
-        raise HTTPException(status_code=503, detail="Agent not initialized")
-    return await _orchestrator.neo4j.get_graph_stats()
+@router.get("/graph/stats", response_model=None)
+@ttl_cache(5)
+async def graph_stats(orchestrator: AgentOrchestrator = Depends(get_orchestrator)):
+    return await orchestrator.neo4j.get_graph_stats()
 
 
-@router.get("/model/status")
-async def model_status():
-    if not _orchestrator:
-        raise HTTPException(status_code=503, detail="Agent not initialized")
-    return await _orchestrator.fastino.get_model_status()
+@router.get("/model/status", response_model=None)
+@ttl_cache(5)
+async def model_status(orchestrator: AgentOrchestrator = Depends(get_orchestrator)):
+    return await orchestrator.fastino.get_model_status()
 
 
 @router.get("/alerts")
-async def get_alerts():
-    if not _orchestrator:
-        raise HTTPException(status_code=503, detail="Agent not initialized")
-    return await _orchestrator.modulate.get_alert_history()
+async def get_alerts(orchestrator: AgentOrchestrator = Depends(get_orchestrator)):
+    return await orchestrator.modulate.get_alert_history()
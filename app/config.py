@@ -2,6 +2,7 @@
 Centralized configuration loaded from environment variables.
 Uses Pydantic BaseSettings for validation and .env file support.
 """
+from functools import cache
 from pydantic_settings import BaseSettings
 from typing import Optional
 
@@ -14,42 +15,46 @@ class Settings(BaseSettings):
     robinhood_password: str = ""
     robinhood_mfa_code: Optional[str] = None
     robinhood_device_token: Optional[str] = None
+    robinhood_api_key: str = ""
+    robinhood_private_key: str = ""
+    robinhood_max_concurrency: int = 8
 
     # --- Senso (Context OS) ---
-    senso_api_key: str = "snso_live_8f992ab1cde45009"
+    senso_api_key: str = ""
     senso_base_url: str = "https://api.senso.ai"
 
     # --- Airbyte ---
-    airbyte_api_key: str = "air_live_v2_982hfkjasdfw89"
+    airbyte_api_key: str = ""
     airbyte_base_url: str = "https://api.airbyte.com"
-    airbyte_workspace_id: str = "wksp_v9sdf8v394m23"
+    airbyte_workspace_id: str = ""
 
     # --- Tavily ---
-    tavily_api_key: str = "tvly-live-1b9d03a49f88c120"
+    tavily_api_key: str = ""
 
     # --- Reka ---
-    reka_api_key: str = "reka_live_df892vncx90v82n3"
+    reka_api_key: str = ""
     reka_base_url: str = "https://api.reka.ai"
 
     # --- Neo4j ---
     neo4j_uri: str = "bolt://localhost:7687"
     neo4j_username: str = "neo4j"
-    neo4j_password: str = "neo4j_live_p@ssw0rd99"
+    neo4j_password: str = ""
+    neo4j_warmup_on_start: bool = True
 
     # --- Fastino Labs ---
-    fastino_api_key: str = "fsto_live_38fn29v8dn293jf"
+    fastino_api_key: str = ""
     fastino_base_url: str = "https://api.pioneer.ai"
 
     # --- Yutori ---
-    yutori_api_key: str = "yutori_live_9v8d3n2j9f8dnd"
+    yutori_api_key: str = ""
     yutori_base_url: str = "https://platform.yutori.com"
 
     # --- Numeric ---
-    numeric_api_key: str = "num_live_8f3d9v83nd29f8d"
+    numeric_api_key: str = ""
     numeric_base_url: str = "https://api.numeric.io"
 
     # --- Modulate ---
-    modulate_api_key: str = "mod_live_39dn29v8dn293f"
+    modulate_api_key: str = ""
     modulate_base_url: str = "https://modulate-developer-apis.com"
 
     # --- Deployment ---
@@ -64,7 +69,14 @@ class Settings(BaseSettings):
     anomaly_alert_threshold: float = 0.95
     log_level: str = "INFO"
 
+    # --- API ---
+    # Comma-separated origins allowed to call the API cross-origin (the dashboard itself is same-origin)
+    cors_allow_origins: str = "http://localhost:8000"
+
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
 
-settings = Settings()
+@cache
+def get_settings() -> Settings:
+    """Load settings (and the .env file) once, on first use."""
+    return Settings()
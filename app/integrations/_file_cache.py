@@ -0,0 +1,86 @@
+"""
+Small on-disk JSON cache shared across process restarts.
+Each entry is one file holding a {"ts", "ttl", "value"} envelope; expired entries are unlinked on read.
+Lookups are served from memory; the disk is only read once per key (warm start) and written off-loop.
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class FileCache:
+    """TTL cache persisted as one JSON file per key, with an in-memory copy in front."""
+
+    def __init__(self, dir: str = ".cache", default_ttl: float = 60.0):
+        self.dir = Path(dir)
+        self.default_ttl = default_ttl
+        # key -> (expires_at wall time, value); mirrors what this process wrote or loaded
+        self._memo: Dict[str, Tuple[float, Any]] = {}
+        # Keys whose file has already been consulted; the memo is authoritative for them
+        self._loaded: Set[str] = set()
+
+    def _path(self, key: str) -> Path:
+        return self.dir / f"{hashlib.md5(key.encode()).hexdigest()}.json"
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        if key not in self._loaded:
+            self._loaded.add(key)
+            entry = await asyncio.to_thread(self._read, key)
+            if entry is not None:
+                self._memo[key] = entry
+        entry = self._memo.get(key)
+        if entry is None:
+            return None
+        if time.time() >= entry[0]:
+            del self._memo[key]
+            return None
+        return entry[1]
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a JSON-serializable value. Write failures are logged, never raised."""
+        ttl = ttl or self.default_ttl
+        now = time.time()
+        self._memo[key] = (now + ttl, value)
+        self._loaded.add(key)
+        await asyncio.to_thread(self._write, key, {"ts": now, "ttl": ttl, "value": value})
+
+    async def delete(self, key: str) -> None:
+        self._memo.pop(key, None)
+        self._loaded.add(key)
+        await asyncio.to_thread(self._path(key).unlink, missing_ok=True)
+
+    def _read(self, key: str) -> Optional[Tuple[float, Any]]:
+        path = self._path(key)
+        try:
+            envelope = orjson.loads(path.read_bytes())
+            expires_at, value = envelope["ts"] + envelope["ttl"], envelope["value"]
+        except FileNotFoundError:
+            return None
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning(f"Discarding unreadable cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        if time.time() >= expires_at:
+            path.unlink(missing_ok=True)
+            return None
+        return expires_at, value
+
+    def _write(self, key: str, envelope: Dict[str, Any]) -> None:
+        path = self._path(key)
+        try:
+            self.dir.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(orjson.dumps(envelope))
+            # Atomic rename so concurrent readers never see a partial file
+            tmp.replace(path)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Failed to write cache entry {path.name}: {e}")
@@ -0,0 +1,32 @@
+"""
+Process-wide HTTP client shared by the plain-REST integrations.
+One connection pool means keep-alive connections and TLS sessions are reused across services.
+"""
+from typing import Optional
+
+import httpx
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0, connect=2.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=1,
+                limits=httpx.Limits(max_connections=512, max_keepalive_connections=64, keepalive_expiry=60.0),
+            ),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client (app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -3,9 +3,18 @@ Airbyte — Continuous real-time data ingestion from external sources.
 Handles economic data, external market APIs, and other streaming data.
 """
 from app.integrations.base import BaseIntegration
-from typing import List, Dict, Any
+from types import MappingProxyType
+from typing import List, Any, Mapping, Tuple
 from datetime import datetime
 
+# Static mock records, shared read-only across calls
+_ECON_RECORDS: Tuple[Mapping[str, Any], ...] = (
+    MappingProxyType({"indicator": "CPI", "value": 3.2, "date": "2026-02-01", "source": "BLS"}),
+    MappingProxyType({"indicator": "unemployment_rate", "value": 4.1, "date": "2026-02-01", "source": "BLS"}),
+    MappingProxyType({"indicator": "fed_funds_rate", "value": 4.75, "date": "2026-02-01", "source": "FRED"}),
+    MappingProxyType({"indicator": "gdp_growth", "value": 2.8, "date": "2026-01-01", "source": "BEA"}),
+)
+
 
 class AirbyteClient(BaseIntegration):
     """
@@ -26,7 +35,7 @@ class AirbyteClient(BaseIntegration):
         return True
 
     async def health_check(self) -> dict:
-        return {"name": self.name, "status": "healthy", "mode": "live" if self.api_key else "mock"}
+        return {**self._health_template, "mode": "live" if self.api_key else "mock"}
 
     async def shutdown(self) -> None:
         pass
@@ -35,14 +44,9 @@ class AirbyteClient(BaseIntegration):
         """Trigger a sync for a given connection."""
         return {"status": "started", "connection_id": connection_id, "job_id": "mock-job-001"}
 
-    async def get_latest_records(self, stream_name: str = "economic_indicators") -> List[Dict[str, Any]]:
-        """Get the latest records from a synced stream."""
-        return [
-            {"indicator": "CPI", "value": 3.2, "date": "2026-02-01", "source": "BLS"},
-            {"indicator": "unemployment_rate", "value": 4.1, "date": "2026-02-01", "source": "BLS"},
-            {"indicator": "fed_funds_rate", "value": 4.75, "date": "2026-02-01", "source": "FRED"},
-            {"indicator": "gdp_growth", "value": 2.8, "date": "2026-01-01", "source": "BEA"},
-        ]
+    async def get_latest_records(self, stream_name: str = "economic_indicators") -> Tuple[Mapping[str, Any], ...]:
+        """Get the latest records from a synced stream (read-only)."""
+        return _ECON_RECORDS
 
     async def list_connections(self) -> List[dict]:
         """List all configured Airbyte connections."""
@@ -3,12 +3,32 @@ Abstract base class for all sponsor integrations.
 Each integration must implement initialize, health_check, and shutdown.
 """
 from abc import ABC, abstractmethod
-from typing import Any
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable
+import asyncio
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
 
+def iso_from_ns(ns: int) -> str:
+    """Format a time.time_ns() value as a naive-UTC ISO string (matches utcnow().isoformat())."""
+    return datetime.fromtimestamp(ns / 1e9, timezone.utc).replace(tzinfo=None).isoformat()
+
+
+_iso_now_cache = (0, "")
+
+
+def iso_now() -> str:
+    """Current naive-UTC time as an ISO string, second resolution, formatted at most once per second."""
+    global _iso_now_cache
+    now = int(time.time())
+    if _iso_now_cache[0] != now:
+        _iso_now_cache = (now, datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None).isoformat())
+    return _iso_now_cache[1]
+
+
 class BaseIntegration(ABC):
     """Base class for all service integrations."""
 
@@ -16,6 +36,8 @@ class BaseIntegration(ABC):
         self.name = name
         self._initialized = False
         self.logger = logging.getLogger(f"integration.{name}")
+        # Static part of every health_check() payload; implementations copy it and add live fields
+        self._health_template = {"name": name, "status": "healthy"}
 
     @abstractmethod
     async def initialize(self) -> bool:
@@ -24,9 +46,23 @@ class BaseIntegration(ABC):
 
     @abstractmethod
     async def health_check(self) -> dict:
-        """Check if the integration is healthy. Returns status dict."""
+        """Check if the integration is healthy. Returns status dict.
+
+        Implementations must not block (no time.sleep, no sync I/O) — they are
+        fanned out concurrently by gather_health.
+        """
         ...
 
+    @classmethod
+    async def gather_health(cls, clients: Iterable["BaseIntegration"]) -> Dict[str, dict]:
+        """Run health checks concurrently; a failing integration reports an error instead of raising."""
+        clients = list(clients)
+        results = await asyncio.gather(*(c.health_check() for c in clients), return_exceptions=True)
+        return {
+            client.name: {"status": "error", "error": str(r)} if isinstance(r, Exception) else r
+            for client, r in zip(clients, results)
+        }
+
     @abstractmethod
     async def shutdown(self) -> None:
         """Clean shutdown of the integration."""
@@ -4,7 +4,7 @@ Evaluates arbitrage opportunities using Neo4j graph data and market context.
 """
 from app.integrations.base import BaseIntegration
 from app.agent.models import ArbitrageOpportunity
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import random
 
 
@@ -18,6 +18,7 @@ class FastinoClient(BaseIntegration):
         super().__init__("fastino")
         self.api_key = api_key
         self.base_url = base_url
+        self._rng = random.Random()  # dedicated instance for mock-score noise
 
     async def initialize(self) -> bool:
         self._initialized = True
@@ -25,7 +26,7 @@ class FastinoClient(BaseIntegration):
         return True
 
     async def health_check(self) -> dict:
-        return {"name": self.name, "status": "healthy", "mode": "live" if self.api_key else "mock" if not self.api_key else "live"}
+        return {**self._health_template, "mode": "live" if self.api_key else "mock"}
 
     async def shutdown(self) -> None:
         pass
@@ -36,19 +37,25 @@ class FastinoClient(BaseIntegration):
         Predict the success probability of an arbitrage opportunity.
         Returns a score between 0.0 and 1.0.
         """
-        # Mock scoring — in production, this calls the Fastino/Pioneer fine-tuned model
-        spread = abs(opportunity_data.get("spread_pct", 0))
-        sentiment = opportunity_data.get("sentiment_score", 0)
-        correlations = len(opportunity_data.get("correlations", []))
-
-        # Weighted scoring heuristic (mock)
-        base_score = min(spread / 10.0, 0.4)
-        sentiment_bonus = max(sentiment * 0.3, 0)
-        correlation_bonus = min(correlations * 0.05, 0.2)
-        noise = random.uniform(-0.05, 0.05)
+        return (await self.predict_opportunity_batch([opportunity_data], graph_context))[0]
 
-        score = max(0.0, min(1.0, base_score + sentiment_bonus + correlation_bonus + noise))
-        return round(score, 4)
+    async def predict_opportunity_batch(self, batch: List[Dict[str, Any]],
+                                        graph_context: Dict[str, Any] = None) -> List[float]:
+        """
+        Score many opportunities at once. In production this is a single
+        request carrying the whole batch; returns scores in input order.
+        """
+        # Mock scoring — in production, this calls the Fastino/Pioneer fine-tuned model
+        uniform = self._rng.uniform
+        scores = []
+        for opp in batch:
+            # Weighted scoring heuristic (mock)
+            base_score = min(abs(opp.get("spread_pct", 0)) / 10.0, 0.4)
+            sentiment_bonus = max(opp.get("sentiment_score", 0) * 0.3, 0)
+            correlation_bonus = min(len(opp.get("correlations", [])) * 0.05, 0.2)
+            noise = uniform(-0.05, 0.05)
+            scores.append(round(max(0.0, min(1.0, base_score + sentiment_bonus + correlation_bonus + noise)), 4))
+        return scores
 
     async def fine_tune(self, training_data: list) -> dict:
         """Submit training data for model fine-tuning."""
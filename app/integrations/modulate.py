@@ -2,9 +2,10 @@
 Modulate — Voice API for emergency alerts.
 Synthesizes voice warnings when highly unusual, high-risk/high-reward anomalies are detected.
 """
-from app.integrations.base import BaseIntegration
-from typing import Optional, Dict, Any
-from datetime import datetime
+import time
+from collections import OrderedDict, deque
+from app.integrations.base import BaseIntegration, iso_from_ns
+from typing import Optional, Dict, Any, Deque, Tuple
 
 
 class ModulateClient(BaseIntegration):
@@ -17,7 +18,11 @@ class ModulateClient(BaseIntegration):
         super().__init__("modulate")
         self.api_key = api_key
         self.base_url = base_url
-        self._alerts: list = []
+        self._alerts: Deque[Dict[str, Any]] = deque(maxlen=10_000)
+        self._alert_seq = 0
+        # LRU of synthesized warnings — identical (text, voice) pairs recur constantly
+        self._tts_cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._tts_cache_size = 256
 
     async def initialize(self) -> bool:
         self._initialized = True
@@ -25,8 +30,8 @@ class ModulateClient(BaseIntegration):
         return True
 
     async def health_check(self) -> dict:
-        return {"name": self.name, "status": "healthy", "mode": "live" if self.api_key else "mock",
-                "alerts_sent": len(self._alerts)}
+        return {**self._health_template, "mode": "live" if self.api_key else "mock",
+                "alerts_sent": self._alert_seq, "alerts_retained": len(self._alerts)}
 
     async def shutdown(self) -> None:
         pass
@@ -34,13 +39,14 @@ class ModulateClient(BaseIntegration):
     async def send_alert(self, message: str, severity: str = "critical",
                          opportunity_id: Optional[str] = None) -> Dict[str, Any]:
         """Send a voice emergency alert."""
+        self._alert_seq += 1
         alert = {
-            "id": f"alert-{len(self._alerts) + 1}",
+            "id": f"alert-{self._alert_seq}",
             "message": message,
             "severity": severity,
             "opportunity_id": opportunity_id,
             "status": "sent",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp_ns": time.time_ns(),
         }
         self._alerts.append(alert)
         self.logger.warning(f"🚨 VOICE ALERT [{severity.upper()}]: {message}")
@@ -48,14 +54,23 @@ class ModulateClient(BaseIntegration):
 
     async def synthesize_warning(self, text: str, voice: str = "urgent_male") -> Dict[str, Any]:
         """Synthesize a voice warning message."""
-        return {
-            "text": text,
-            "voice": voice,
-            "duration_seconds": len(text) * 0.06,
-            "audio_url": "mock://modulate/audio/warning.wav",
-            "status": "synthesized",
-        }
+        key = (text, voice)
+        cached = self._tts_cache.get(key)
+        if cached is None:
+            cached = self._tts_cache[key] = {
+                "text": text,
+                "voice": voice,
+                "duration_seconds": len(text) * 0.06,
+                "audio_url": "mock://modulate/audio/warning.wav",
+                "status": "synthesized",
+            }
+            if len(self._tts_cache) > self._tts_cache_size:
+                self._tts_cache.popitem(last=False)
+        else:
+            self._tts_cache.move_to_end(key)
+        # Shallow copy so callers can't mutate the cached entry
+        return dict(cached)
 
     async def get_alert_history(self) -> list:
         """Get history of all alerts sent."""
-        return self._alerts.copy()
+        return [{**alert, "timestamp": iso_from_ns(alert["timestamp_ns"])} for alert in self._alerts]
@@ -2,9 +2,15 @@
 Neo4j — Knowledge Graph and Memory.
 Stores complex relationships between global events, market movements, and past trades.
 """
+import time
+from collections import OrderedDict
 from app.integrations.base import BaseIntegration
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    from neo4j import AsyncGraphDatabase
+except ImportError:  # optional: the client falls back to the in-memory graph
+    AsyncGraphDatabase = None
 
 
 class Neo4jClient(BaseIntegration):
@@ -14,46 +20,140 @@ class Neo4jClient(BaseIntegration):
     """
 
     def __init__(self, uri: str = "bolt://localhost:7687",
-                 username: str = "neo4j", password: str = ""):
+                 username: str = "neo4j", password: str = "", warmup_on_start: bool = True):
         super().__init__("neo4j")
         self.uri = uri
         self.username = username
         self.password = password
+        self.warmup_on_start = warmup_on_start
         self._mock_graph: List[Dict[str, Any]] = []
+        self._driver = None
+        # LRU+TTL cache of correlation lookups. Event writes (price snapshots every cycle) don't touch
+        # CORRELATES_WITH edges, so they don't invalidate it; the TTL bounds staleness
+        self._corr_cache: "OrderedDict[tuple, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._corr_cache_size = 256
+        self._corr_cache_ttl = 60.0
 
     async def initialize(self) -> bool:
-        if self.password:
+        if self.password and AsyncGraphDatabase is None:
+            self.logger.warning("neo4j driver not installed — using mock")
+        elif self.password:
             try:
-                from neo4j import GraphDatabase
-                self._driver = GraphDatabase.driver(self.uri, auth=(self.username, self.password))
-                self._driver.verify_connectivity()
+                self._driver = AsyncGraphDatabase.driver(
+                    self.uri, auth=(self.username, self.password),
+                    max_connection_pool_size=50,
+                    connection_acquisition_timeout=30,
+                    max_connection_lifetime=3600,
+                    user_agent="arb-agent/1.0",
+                )
+                await self._driver.verify_connectivity()
+                if self.warmup_on_start:
+                    await self._warm_page_cache()
                 self._initialized = True
                 self.logger.info("✅ Neo4j connected (live mode)")
                 return True
             except Exception as e:
+                self._driver = None
                 self.logger.warning(f"Neo4j connection failed, using mock: {e}")
 
         self._initialized = True
         self.logger.info("✅ Neo4j initialized (mock mode)")
         return True
 
+    async def _warm_page_cache(self) -> None:
+        """Pre-load store files into the page cache so the first queries don't hit disk."""
+        start = time.perf_counter()
+        try:
+            async with self._driver.session() as session:
+                await (await session.run("CALL apoc.warmup.run(true, true, true)")).consume()
+        except Exception:
+            # APOC not installed — counting nodes still touches the node store
+            try:
+                async with self._driver.session() as session:
+                    await (await session.run("MATCH (n) RETURN count(n)")).consume()
+            except Exception as e:
+                self.logger.warning(f"Neo4j warmup skipped: {e}")
+                return
+        self.logger.info(f"Neo4j page cache warmed in {time.perf_counter() - start:.2f}s")
+
     async def health_check(self) -> dict:
-        return {"name": self.name, "status": "healthy", "mode": "live" if self.password else "mock", "nodes": len(self._mock_graph)}
+        return {**self._health_template, "mode": "live" if self.password else "mock", "nodes": len(self._mock_graph)}
 
     async def shutdown(self) -> None:
-        if hasattr(self, "_driver"):
-            self._driver.close()
+        if self._driver:
+            await self._driver.close()
 
     async def store_event(self, event_type: str, data: Dict[str, Any]) -> str:
         """Store a market event or trade in the knowledge graph."""
         node = {"id": f"event-{len(self._mock_graph)}", "type": event_type,
-                "data": data, "created_at": datetime.utcnow().isoformat()}
+                "data": data, "created_at_ns": time.time_ns()}
         self._mock_graph.append(node)
         return node["id"]
 
+    async def store_events_batch(self, event_type: str, rows: List[Dict[str, Any]]) -> List[str]:
+        """Store many events of one type in a single round trip (UNWIND)."""
+        if not rows:
+            return []
+        if self._driver:
+            async def _write(tx):
+                result = await tx.run(
+                    "UNWIND $rows AS r CREATE (n:Event) SET n = r, n.type = $event_type",
+                    rows=rows, event_type=event_type,
+                )
+                await result.consume()
+
+            try:
+                async with self._driver.session() as session:
+                    await session.execute_write(_write)
+            except Exception as e:
+                self.logger.warning(f"Neo4j batch write failed, keeping events in memory only: {e}")
+        created_at_ns = time.time_ns()
+        start = len(self._mock_graph)
+        self._mock_graph.extend(
+            {"id": f"event-{start + i}", "type": event_type, "data": data, "created_at_ns": created_at_ns}
+            for i, data in enumerate(rows)
+        )
+        return [f"event-{start + i}" for i in range(len(rows))]
+
     async def find_correlations(self, event_type: str, symbol: str = "",
                                 lookback_days: int = 30) -> List[Dict[str, Any]]:
-        """Find historical correlations between events and market movements."""
+        """Find historical correlations between events and market movements (cached; treat as read-only)."""
+        key = (event_type, symbol, lookback_days)
+        now = time.monotonic()
+        hit = self._corr_cache.get(key)
+        if hit and now - hit[0] < self._corr_cache_ttl:
+            self._corr_cache.move_to_end(key)
+            return hit[1]
+
+        correlations = await self._query_correlations(event_type, symbol, lookback_days)
+        self._corr_cache[key] = (now, correlations)
+        self._corr_cache.move_to_end(key)
+        while len(self._corr_cache) > self._corr_cache_size:
+            self._corr_cache.popitem(last=False)
+        return correlations
+
+    async def _query_correlations(self, event_type: str, symbol: str,
+                                  lookback_days: int) -> List[Dict[str, Any]]:
+        if self._driver:
+            try:
+                # Stream records as Bolt delivers them instead of buffering via result.data()
+                correlations = []
+                async with self._driver.session() as session:
+                    result = await session.run(
+                        "MATCH (:Event {type: $event_type})-[c:CORRELATES_WITH]->(m:Event) "
+                        "WHERE $symbol = '' OR c.symbol = $symbol "
+                        "RETURN m.type AS event, c.correlation AS correlation, "
+                        "c.impact AS impact, c.occurrences AS occurrences "
+                        "ORDER BY correlation DESC LIMIT 20",
+                        event_type=event_type, symbol=symbol,
+                    )
+                    async for record in result:
+                        correlations.append(dict(record))
+                if correlations:
+                    return correlations
+            except Exception as e:
+                self.logger.warning(f"Neo4j correlation query failed, using mock: {e}")
+
         return [
             {"event": "fed_rate_decision", "correlation": 0.82,
              "impact": "BTC +3.2% avg within 48h of dovish signal", "occurrences": 12},
@@ -2,9 +2,11 @@
 Numeric — Structured accounting and P&L tracking.
 Simulates clean trade accounting that feeds the agent's self-improvement loop.
 """
+from collections import deque
+from itertools import islice
 from app.integrations.base import BaseIntegration
 from app.agent.models import TradeResult, PnLRecord
-from typing import List, Dict, Any
+from typing import Deque, Dict, Any, Optional
 from datetime import datetime
 
 
@@ -18,8 +20,15 @@ class NumericClient(BaseIntegration):
         super().__init__("numeric")
         self.api_key = api_key
         self.base_url = base_url
-        self._ledger: List[Dict[str, Any]] = []
+        # Bounded ledger for reports; aggregates are kept as running counters
+        self._ledger: Deque[Dict[str, Any]] = deque(maxlen=10_000)
         self._total_pnl: float = 0.0
+        self._entry_seq = 0
+        self._trade_count = 0
+        self._win_count = 0
+        self._loss_count = 0
+        self._best_pnl: Optional[float] = None
+        self._worst_pnl: Optional[float] = None
 
     async def initialize(self) -> bool:
         self._initialized = True
@@ -27,7 +36,7 @@ class NumericClient(BaseIntegration):
         return True
 
     async def health_check(self) -> dict:
-        return {"name": self.name, "status": "healthy", "mode": "live" if self.api_key else "mock",
+        return {**self._health_template, "mode": "live" if self.api_key else "mock",
                 "total_entries": len(self._ledger), "total_pnl": self._total_pnl}
 
     async def shutdown(self) -> None:
@@ -35,8 +44,10 @@ class NumericClient(BaseIntegration):
 
     async def log_trade(self, trade: TradeResult) -> dict:
         """Log a trade execution to the accounting ledger."""
+        self._entry_seq += 1
+        self._trade_count += 1
         entry = {
-            "id": f"ledger-{len(self._ledger) + 1}",
+            "id": f"ledger-{self._entry_seq}",
             "opportunity_id": trade.opportunity_id,
             "action": trade.action.value,
             "asset": trade.asset,
@@ -44,35 +55,43 @@ class NumericClient(BaseIntegration):
             "price": trade.price,
             "total_value": trade.quantity * trade.price,
             "simulated": trade.simulated,
-            "timestamp": trade.executed_at.isoformat(),
+            "timestamp": trade.executed_at,  # formatted when a report is built
         }
         self._ledger.append(entry)
         return entry
 
     async def get_pnl(self, period: str = "all") -> Dict[str, Any]:
         """Get P&L summary for a given period."""
+        closed = self._win_count + self._loss_count
         return {
             "period": period,
             "total_pnl": self._total_pnl,
-            "total_trades": len(self._ledger),
-            "winning_trades": int(len(self._ledger) * 0.6),
-            "losing_trades": int(len(self._ledger) * 0.4),
-            "win_rate": 0.60,
-            "best_trade": 450.25,
-            "worst_trade": -180.50,
+            "total_trades": self._trade_count,
+            "winning_trades": self._win_count,
+            "losing_trades": self._loss_count,
+            "win_rate": round(self._win_count / closed, 4) if closed else 0.0,
+            "best_trade": self._best_pnl if closed else 0.0,
+            "worst_trade": self._worst_pnl if closed else 0.0,
             "sharpe_ratio": 1.45,
         }
 
     async def record_pnl(self, record: PnLRecord) -> None:
         """Record a completed P&L entry."""
+        self._entry_seq += 1
         self._total_pnl += record.pnl
+        self._win_count += record.pnl > 0
+        self._loss_count += record.pnl <= 0
+        if self._best_pnl is None or record.pnl > self._best_pnl:
+            self._best_pnl = record.pnl
+        if self._worst_pnl is None or record.pnl < self._worst_pnl:
+            self._worst_pnl = record.pnl
         entry = {
             "type": "pnl",
             "trade_id": record.trade_id,
             "pnl": record.pnl,
             "pnl_pct": record.pnl_pct,
             "asset": record.asset,
-            "timestamp": record.recorded_at.isoformat(),
+            "timestamp": record.recorded_at,
         }
         self._ledger.append(entry)
 
@@ -82,6 +101,9 @@ class NumericClient(BaseIntegration):
         return {
             "report_date": datetime.utcnow().isoformat(),
             "summary": pnl,
-            "entries": self._ledger[-10:],  # Last 10 entries
-            "total_entries": len(self._ledger),
+            "entries": [  # Last 10 entries
+                {**entry, "timestamp": entry["timestamp"].isoformat()}
+                for entry in islice(self._ledger, max(0, len(self._ledger) - 10), None)
+            ],
+            "total_entries": self._entry_seq,
         }
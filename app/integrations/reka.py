@@ -24,7 +24,7 @@ class RekaClient(BaseIntegration):
         return True
 
     async def health_check(self) -> dict:
-        return {"name": self.name, "status": "healthy", "mode": "live" if self.api_key else "mock" if not self.api_key else "live"}
+        return {**self._health_template, "mode": "live" if self.api_key else "mock"}
 
     async def shutdown(self) -> None:
         pass
@@ -2,20 +2,35 @@
 Robinhood API Wrapper — Read-only access to real-time crypto quotes and portfolio data.
 Uses official Robinhood Crypto API Keys (Base64) for authentication and data fetching.
 """
+import asyncio
 import logging
 import base64
 import time
 import httpx
+from contextlib import AsyncExitStack
 import uuid
-import json
-from typing import Optional, List
+import weakref
+import orjson
+from typing import Optional, List, Dict, Sequence, Tuple
 from datetime import datetime
 
 from app.integrations.base import BaseIntegration
+from app.integrations._file_cache import FileCache
 from app.agent.models import MarketData, AssetType
 
+try:
+    import nacl.signing as _nacl_signing
+except ImportError:  # optional: without pynacl the client runs in mock mode
+    _nacl_signing = None
+
 logger = logging.getLogger(__name__)
 
+# Mock-mode reference prices
+_MOCK_CRYPTO_PRICES = {"BTC": 97250.00, "ETH": 3420.50, "DOGE": 0.245, "SOL": 195.30}
+_MOCK_STOCK_PRICES = {"AAPL": 245.80, "TSLA": 342.15, "NVDA": 875.60, "SPY": 520.30, "DJT": 32.50}
+_MOCK_BID_MULT = 0.999
+_MOCK_ASK_MULT = 1.001
+
 
 class RobinhoodClient(BaseIntegration):
     """
@@ -26,14 +41,50 @@ class RobinhoodClient(BaseIntegration):
     Uses standard API requests authenticated via pynacl (Ed25519) signatures.
     """
 
-    def __init__(self, api_key: str = "", private_key: str = ""):
+    def __init__(self, api_key: str = "", private_key: str = "",
+                 semaphore: Optional[asyncio.Semaphore] = None, watchlist: Sequence[str] = ()):
         super().__init__("robinhood")
         self.api_key = api_key
         self.private_key_base64 = private_key
         self.base_url = "https://trading.robinhood.com"
         self._authenticated = False
-        self.client = httpx.AsyncClient(base_url=self.base_url)
+        self._sem = semaphore or asyncio.Semaphore(8)
+        # Token bucket smoothing bursts to the API's sustained request rate
+        self._rate = 5.0
+        self._tokens = self._rate
+        self._last_refill = time.monotonic()
+        self._bucket_lock = asyncio.Lock()
+        # Per-symbol live quote cache, keyed by upper-cased symbol; the locks coalesce concurrent
+        # misses into one request. Weak values: a lock lives only while some caller holds or awaits it
+        self._quote_cache: Dict[str, Tuple[float, MarketData]] = {}
+        self._quote_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+        self._quote_ttl = 1.0
+        self._quote_cache_size = 1024
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # Background refresh keeps the watchlist's quotes warm so the agent loop reads from cache
+        self.watchlist = tuple(s.upper() for s in watchlist)
+        self._prefetch_task: Optional[asyncio.Task] = None
+        # HTTP/2 multiplexes the small polling requests over a warm keep-alive pool;
+        # one transport-level retry absorbs transient connect/DNS failures
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(5.0, connect=2.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=1,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0),
+            ),
+        )
         self.signer = None
+        self._api_key_bytes = b""
+        self._base_headers: Dict[str, str] = {}
+        # Holdings change only on fills; persist them so warm restarts skip the refetch
+        self._file_cache = FileCache(".cache/robinhood", default_ttl=60)
+        # Signatures only vary by second, so identical requests within one second share one
+        self._sig_cache: Dict[Tuple[str, str, bytes, str], str] = {}
+        self._sig_cache_ts = ""
+        self._sig_cache_ts_bytes = b""
 
     async def initialize(self) -> bool:
         """Authenticate with Robinhood. Returns True if successful."""
@@ -42,15 +93,20 @@ class RobinhoodClient(BaseIntegration):
             self._initialized = True
             return True
 
+        if _nacl_signing is None:
+            self.logger.warning("pynacl not installed — running in mock mode")
+            self._authenticated = False
+            self._initialized = True
+            return True
+
         try:
-            import nacl.signing
             private_key_seed = base64.b64decode(self.private_key_base64)
-            self.signer = nacl.signing.SigningKey(private_key_seed)
+            self.signer = _nacl_signing.SigningKey(private_key_seed)
+            # Pre-encode the per-key parts of every signed request
+            self._api_key_bytes = self.api_key.encode()
+            self._base_headers = {"x-api-key": self.api_key, "Content-Type": "application/json"}
             self._authenticated = True
             self.logger.info("✅ Robinhood official API keys configured")
-        except ImportError:
-            self.logger.warning("pynacl not installed — running in mock mode")
-            self._authenticated = False
         except Exception as e:
             self.logger.error(f"Robinhood auth failed: {e}")
             self._authenticated = False
@@ -63,39 +119,112 @@ class RobinhoodClient(BaseIntegration):
         self.api_key = api_key
         self.private_key_base64 = private_key
         self._authenticated = False
+        await self.cache_clear()
         return await self.initialize()
 
-    def _get_headers(self, method: str, path: str, body: str = "") -> dict:
+    async def cache_clear(self) -> None:
+        """Drop all cached quotes and signatures."""
+        self._quote_cache.clear()
+        self._sig_cache.clear()
+        await self._file_cache.delete(self._holdings_cache_key)
+
+    @property
+    def _holdings_cache_key(self) -> str:
+        return f"GET|/api/v1/crypto/trading/holdings/|{self.api_key}"
+
+    def _cached_quote(self, symbol: str) -> Optional[MarketData]:
+        ts, md = self._quote_cache.get(symbol, (0.0, None))
+        if md is not None and time.monotonic() - ts < self._quote_ttl:
+            return md
+        return None
+
+    def _get_headers(self, method: str, path: str, body: bytes = b"") -> dict:
         timestamp = str(int(time.time()))
-        message = f"{self.api_key}{timestamp}{path}{method}{body}"
-        signed = self.signer.sign(message.encode("utf-8"))
-        signature = base64.b64encode(signed.signature).decode("utf-8")
-        return {
-            "x-api-key": self.api_key,
-            "x-signature": signature,
-            "x-timestamp": timestamp,
-            "Content-Type": "application/json"
-        }
+        if timestamp != self._sig_cache_ts:
+            # Entries from earlier seconds can never be hit again
+            self._sig_cache.clear()
+            self._sig_cache_ts = timestamp
+            self._sig_cache_ts_bytes = timestamp.encode()
+        key = (method, path, body, timestamp)
+        signature = self._sig_cache.get(key)
+        if signature is None:
+            message = b"".join((self._api_key_bytes, self._sig_cache_ts_bytes, path.encode(), method.encode(), body))
+            signed = self.signer.sign(message)
+            signature = self._sig_cache[key] = base64.b64encode(signed.signature).decode("utf-8")
+        return {**self._base_headers, "x-signature": signature, "x-timestamp": timestamp}
+
+    async def _acquire_token(self) -> None:
+        async with self._bucket_lock:
+            now = time.monotonic()
+            self._tokens = min(self._rate, self._tokens + (now - self._last_refill) * self._rate)
+            self._last_refill = now
+            if self._tokens < 1.0:
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
+                self._tokens = 1.0
+                self._last_refill = time.monotonic()
+            self._tokens -= 1.0
 
     async def _make_request(self, method: str, path: str, json_body: dict = None):
-        body_str = ""
-        if json_body:
-            body_str = json.dumps(json_body)
-        headers = self._get_headers(method, path, body_str)
-        req = self.client.build_request(method, self.base_url + path, headers=headers, content=body_str if body_str else None)
-        resp = await self.client.send(req)
+        body = orjson.dumps(json_body) if json_body else b""
+        for attempt in range(3):
+            # Re-sign per attempt so the timestamp stays fresh
+            headers = self._get_headers(method, path, body)
+            async with self._sem:
+                await self._acquire_token()
+                try:
+                    resp = await self.client.request(method, path, headers=headers, content=body or None)
+                except httpx.TransportError:
+                    if attempt == 2:
+                        raise
+                    resp = None
+            if resp is not None and resp.status_code != 429 and resp.status_code < 500:
+                break
+            if attempt < 2:
+                await asyncio.sleep(0.25 * 2 ** attempt)
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
 
     async def health_check(self) -> dict:
         return {
-            "name": self.name,
+            **self._health_template,
             "authenticated": self._authenticated,
             "mode": "live" if self._authenticated else "mock",
-            "status": "healthy",
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses,
         }
 
+    def start_prefetch(self) -> None:
+        """Keep the watchlist quotes warm in the background (while the agent loop runs)."""
+        if self.watchlist and (self._prefetch_task is None or self._prefetch_task.done()):
+            self._prefetch_task = asyncio.create_task(self._prefetcher())
+
+    async def stop_prefetch(self) -> None:
+        if self._prefetch_task is not None:
+            self._prefetch_task.cancel()
+            try:
+                await self._prefetch_task
+            except asyncio.CancelledError:
+                pass
+            self._prefetch_task = None
+
+    async def _prefetcher(self) -> None:
+        """Batch-refresh the watchlist a little faster than the quote TTL expires."""
+        interval = self._quote_ttl * 0.8
+        failures = 0
+        while True:
+            if not self._authenticated:
+                await asyncio.sleep(interval)
+                continue
+            if await self._fetch_crypto_quotes(list(self.watchlist)):
+                failures = 0
+                await asyncio.sleep(interval)
+            else:
+                # Nothing came back (errors are logged by the fetch); back off exponentially
+                failures += 1
+                await asyncio.sleep(min(interval * 2 ** failures, 60.0))
+
     async def shutdown(self) -> None:
+        await self.stop_prefetch()
         try:
             await self.client.aclose()
         except Exception:
@@ -103,63 +232,104 @@ class RobinhoodClient(BaseIntegration):
 
     async def get_crypto_quote(self, symbol: str) -> MarketData:
         """Get real-time crypto quote. Falls back to mock data."""
+        return (await self.get_crypto_quotes([symbol]))[symbol]
+
+    async def get_crypto_quotes(self, symbols: List[str]) -> Dict[str, MarketData]:
+        """Get real-time crypto quotes for many symbols in one request. Falls back to mock data."""
+        quotes: Dict[str, MarketData] = {}
         if self._authenticated:
-            try:
-                # Need to convert BTC to BTC-USD for the official API
-                rh_symbol = symbol
-                if "-" not in symbol:
-                    rh_symbol = f"{symbol}-USD"
-                    
-                path = f"/api/v2/crypto/marketdata/best_bid_ask/?symbol={rh_symbol}"
-                data = await self._make_request("GET", path)
-                
-                if data and "results" in data and len(data["results"]) > 0:
-                    quote = data["results"][0]
-                    price = float(quote.get("price", 0))
-                    bid = float(quote.get("bid_inclusive_of_fee", price))
-                    ask = float(quote.get("ask_inclusive_of_fee", price))
-                    return MarketData(
-                        symbol=symbol,
-                        asset_type=AssetType.CRYPTO,
-                        price=price,
-                        bid=bid,
-                        ask=ask,
-                        volume=None,
-                        source="robinhood_live_official",
-                    )
-            except Exception as e:
-                self.logger.error(f"Failed to fetch crypto quote for {symbol}: {e}")
+            # Cache and lock keys are case-normalised so "btc" and "BTC" share one entry
+            live: Dict[str, MarketData] = {}
+            keys = {s.upper() for s in symbols}
+            for key in keys:
+                quote = self._cached_quote(key)
+                if quote:
+                    live[key] = quote
+            missing = sorted(keys - live.keys())
+            fetched: Dict[str, MarketData] = {}
+            if missing:
+                # Lock in sorted order so overlapping batches can't deadlock
+                async with AsyncExitStack() as stack:
+                    for key in missing:
+                        await stack.enter_async_context(self._quote_locks.setdefault(key, asyncio.Lock()))
+                    # Another caller may have filled the cache while we waited
+                    for key in missing:
+                        quote = self._cached_quote(key)
+                        if quote:
+                            live[key] = quote
+                    missing = [k for k in missing if k not in live]
+                    if missing:
+                        self._cache_misses += len(missing)
+                        fetched = await self._fetch_crypto_quotes(missing)
+            self._cache_hits += len(live)
+            live.update(fetched)
+            quotes = {s: live[s.upper()] for s in symbols if s.upper() in live}
 
         # Mock data fallback
-        mock_prices = {"BTC": 97250.00, "ETH": 3420.50, "DOGE": 0.245, "SOL": 195.30}
-        return MarketData(
-            symbol=symbol,
-            asset_type=AssetType.CRYPTO,
-            price=mock_prices.get(symbol.upper(), 100.0),
-            bid=mock_prices.get(symbol.upper(), 100.0) * 0.999,
-            ask=mock_prices.get(symbol.upper(), 100.0) * 1.001,
-            source="mock",
-        )
+        for symbol in symbols:
+            if symbol not in quotes:
+                price = _MOCK_CRYPTO_PRICES.get(symbol.upper(), 100.0)
+                quotes[symbol] = MarketData.model_construct(
+                    symbol=symbol,
+                    asset_type=AssetType.CRYPTO,
+                    price=price,
+                    bid=price * _MOCK_BID_MULT,
+                    ask=price * _MOCK_ASK_MULT,
+                    source="mock",
+                )
+        return {symbol: quotes[symbol] for symbol in symbols}
+
+    async def _fetch_crypto_quotes(self, symbols: List[str]) -> Dict[str, MarketData]:
+        """Fetch live quotes in a single request and cache them. Failed symbols are omitted."""
+        quotes: Dict[str, MarketData] = {}
+        try:
+            # Need to convert BTC to BTC-USD for the official API
+            rh_symbols = {(s if "-" in s else f"{s}-USD"): s for s in symbols}
+            path = "/api/v2/crypto/marketdata/best_bid_ask/?" + "&".join(f"symbol={s}" for s in rh_symbols)
+            data = await self._make_request("GET", path)
+
+            now = time.monotonic()
+            for quote in (data or {}).get("results", []):
+                symbol = rh_symbols.get(quote.get("symbol"))
+                if symbol is None:
+                    continue
+                quotes[symbol] = md = MarketData.from_robinhood_quote(quote, symbol)
+                # Re-insert so dict order tracks freshness; the stalest entry is always first
+                self._quote_cache.pop(symbol, None)
+                self._quote_cache[symbol] = (now, md)
+            while len(self._quote_cache) > self._quote_cache_size:
+                del self._quote_cache[next(iter(self._quote_cache))]
+        except Exception as e:
+            self.logger.error(f"Failed to fetch crypto quotes for {', '.join(symbols)}: {e}")
+        return quotes
 
     async def get_stock_quote(self, symbol: str) -> MarketData:
         """Stocks are not supported on Robinhood Crypto API, returns mock data."""
-        # Mock data fallback
-        mock_prices = {"AAPL": 245.80, "TSLA": 342.15, "NVDA": 875.60, "SPY": 520.30, "DJT": 32.50}
-        return MarketData(
-            symbol=symbol,
-            asset_type=AssetType.STOCK,
-            price=mock_prices.get(symbol.upper(), 150.0),
-            bid=mock_prices.get(symbol.upper(), 150.0) * 0.999,
-            ask=mock_prices.get(symbol.upper(), 150.0) * 1.001,
-            source="mock",
-        )
+        return (await self.get_stock_quotes([symbol]))[symbol]
+
+    async def get_stock_quotes(self, symbols: List[str]) -> Dict[str, MarketData]:
+        """Get stock quotes for many symbols at once. Mock data only (see get_stock_quote)."""
+        quotes: Dict[str, MarketData] = {}
+        for symbol in symbols:
+            if symbol in quotes:
+                continue
+            price = _MOCK_STOCK_PRICES.get(symbol.upper(), 150.0)
+            quotes[symbol] = MarketData.model_construct(
+                symbol=symbol,
+                asset_type=AssetType.STOCK,
+                price=price,
+                bid=price * _MOCK_BID_MULT,
+                ask=price * _MOCK_ASK_MULT,
+                source="mock",
+            )
+        return quotes
 
     async def get_portfolio(self) -> dict:
         """Get current portfolio holdings. Uses get_crypto_positions."""
         if self._authenticated:
             try:
                 positions = await self.get_crypto_positions()
-                total_equity = sum([p["quantity"] * p["cost_bases"] for p in positions]) # rough estimate
+                total_equity = sum(p["quantity"] * p["cost_bases"] for p in positions)  # rough estimate
                 return {
                     "equity": total_equity,
                     "cash": 0, # Crypto API doesn't give fiat cash directly without another endpoint
@@ -185,19 +355,25 @@ class RobinhoodClient(BaseIntegration):
     async def get_crypto_positions(self) -> list:
         """Get crypto-specific positions."""
         if self._authenticated:
+            cached = await self._file_cache.get(self._holdings_cache_key)
+            if cached is not None:
+                return cached
             try:
                 path = "/api/v1/crypto/trading/holdings/"
                 data = await self._make_request("GET", path)
                 
                 if data and "results" in data:
-                    return [
+                    positions = [
                         {
                             "symbol": pos.get("asset_code", "UNKNOWN"),
-                            "quantity": float(pos.get("total_quantity", 0)),
+                            "quantity": quantity,
                             "cost_bases": float(pos.get("quantity_available_for_trading", 0)) # Using available as a proxy for mock
                         }
-                        for pos in data["results"] if float(pos.get("total_quantity", 0)) > 0
+                        for pos in data["results"]
+                        if (quantity := float(pos.get("total_quantity", 0))) > 0
                     ]
+                    await self._file_cache.set(self._holdings_cache_key, positions)
+                    return positions
             except Exception as e:
                 self.logger.error(f"Failed to fetch crypto positions: {e}")
 
@@ -2,9 +2,8 @@
 Senso (Context OS) — Agent state and context management.
 Manages the agent's working memory, workflow state, and context persistence.
 """
-from app.integrations.base import BaseIntegration
+from app.integrations.base import BaseIntegration, iso_now
 from typing import Any, Dict, Optional
-from datetime import datetime
 
 
 class SensoClient(BaseIntegration):
@@ -23,7 +22,7 @@ class SensoClient(BaseIntegration):
     async def initialize(self) -> bool:
         self._context = {
             "agent_id": "arbitrage-agent-v1",
-            "started_at": datetime.utcnow().isoformat(),
+            "started_at": iso_now(),
             "mode": "autonomous",
         }
         self._initialized = True
@@ -31,21 +30,31 @@ class SensoClient(BaseIntegration):
         return True
 
     async def health_check(self) -> dict:
-        return {"name": self.name, "status": "healthy", "mode": "live" if self.api_key else "mock", "context_keys": len(self._context)}
+        return {**self._health_template, "mode": "live" if self.api_key else "mock", "context_keys": len(self._context)}
 
     async def shutdown(self) -> None:
-        self._context.clear()
+        self._context = {}
 
     async def get_context(self, key: Optional[str] = None) -> Any:
-        """Get the current agent context or a specific key."""
+        """Get the current agent context or a specific key.
+
+        The full context is returned as a live snapshot — treat it as read-only.
+        Writers swap in a new dict (copy-on-write), so a snapshot never changes under a reader.
+        """
         if key:
             return self._context.get(key)
-        return self._context.copy()
+        return self._context
 
     async def update_context(self, key: str, value: Any) -> None:
         """Update a specific context value."""
-        self._context[key] = value
-        self._context["last_updated"] = datetime.utcnow().isoformat()
+        await self.update_many({key: value})
+
+    async def update_many(self, values: Dict[str, Any]) -> None:
+        """Update several context values with a single copy."""
+        context = dict(self._context)
+        context.update(values)
+        context["last_updated"] = iso_now()
+        self._context = context
 
     async def get_workflow_state(self) -> str:
         """Get the current workflow state."""
@@ -2,11 +2,30 @@
 Tavily — Real-time web search, sentiment analysis, and news aggregation.
 Provides clean, filtered streams of market-relevant information.
 """
+import asyncio
+import time
+import httpx
+import orjson
+from app.integrations import _http
 from app.integrations.base import BaseIntegration
 from app.agent.models import SentimentData
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
+# Common spellings of the same topic, so they share one search and cache entry
+_ALIASES = {
+    "btc": "bitcoin", "xbt": "bitcoin",
+    "eth": "ethereum", "ether": "ethereum",
+    "sol": "solana",
+    "doge": "dogecoin",
+    "cryptocurrency": "crypto", "crypto market": "crypto",
+}
+
+
+def _canon(topic: str) -> str:
+    topic = topic.strip().lower()
+    return _ALIASES.get(topic, topic)
+
 
 class TavilyClient(BaseIntegration):
     """
@@ -14,29 +33,60 @@ class TavilyClient(BaseIntegration):
     Phase 1: Mock implementation with simulated sentiment data.
     """
 
-    def __init__(self, api_key: str = ""):
+    def __init__(self, api_key: str = "", semaphore: Optional[asyncio.Semaphore] = None):
         super().__init__("tavily")
         self.api_key = api_key
+        self._sem = semaphore or asyncio.Semaphore(10)
+        self.search_url = "https://api.tavily.com/search"
+        # Shared async client (attached on initialize when a key is set)
+        self.client: Optional[httpx.AsyncClient] = None
+        # In-flight searches by (query, max_results); concurrent duplicates await the same task
+        self._inflight: Dict[Tuple[str, int], "asyncio.Future[Tuple[List[Dict[str, Any]], bool]]"] = {}
+        # Sentiment search results by canonical topic; sentiment doesn't move faster than this
+        self._sentiment_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._sentiment_ttl = 60.0
 
     async def initialize(self) -> bool:
+        if self.api_key:
+            self.client = _http.get_client()
+            self._initialized = True
+            self.logger.info("✅ Tavily initialized (live mode)")
+            return True
         self._initialized = True
         self.logger.info("✅ Tavily initialized (mock mode)")
         return True
 
     async def health_check(self) -> dict:
-        return {"name": self.name, "status": "healthy", "mode": "mock" if not self.api_key else "live"}
+        return {**self._health_template, "mode": "mock" if not self.api_key else "live"}
 
     async def shutdown(self) -> None:
-        pass
+        # The shared client is closed by the app, not by individual integrations
+        self.client = None
 
     async def search(self, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
-        """Search the web for market-relevant information."""
-        if self.api_key:
+        """Search the web for market-relevant information (concurrent identical searches share one request)."""
+        return (await self._search_shared(query, max_results))[0]
+
+    async def _search_shared(self, query: str, max_results: int) -> Tuple[List[Dict[str, Any]], bool]:
+        """Coalesced search returning (results, live); live is False when the mock fallback was used."""
+        key = (query, max_results)
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(self._search(query, max_results))
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled caller doesn't cancel the search for the others
+        return await asyncio.shield(task)
+
+    async def _search(self, query: str, max_results: int) -> Tuple[List[Dict[str, Any]], bool]:
+        if self.client is not None:
             try:
-                from tavily import TavilyClient as TC
-                client = TC(api_key=self.api_key)
-                response = client.search(query=query, max_results=max_results)
-                return response.get("results", [])
+                body = orjson.dumps({"api_key": self.api_key, "query": query, "max_results": max_results})
+                async with self._sem:
+                    resp = await self.client.post(
+                        self.search_url, content=body, headers={"Content-Type": "application/json"},
+                    )
+                resp.raise_for_status()
+                return orjson.loads(resp.content).get("results", []), True
             except Exception as e:
                 self.logger.error(f"Tavily search failed: {e}")
 
@@ -47,11 +97,26 @@ class TavilyClient(BaseIntegration):
             {"title": f"Breaking: {query} Alert", "url": "https://mock.tavily.com/2",
              "content": f"Unusual volume detected in {query}-related assets across multiple exchanges.",
              "score": 0.87},
-        ]
+        ], False
 
     async def get_sentiment(self, topic: str) -> SentimentData:
         """Analyze sentiment for a given market topic."""
-        results = await self.search(f"{topic} market sentiment analysis")
+        canon = _canon(topic)
+        ts, results = self._sentiment_cache.get(canon, (0.0, None))
+        if results is None or time.monotonic() - ts >= self._sentiment_ttl:
+            results, live = await self._search_shared(f"{canon} market sentiment analysis", 5)
+            # Only cache live results, so a transient failure's mock fallback doesn't stick for a TTL
+            if live:
+                now = time.monotonic()
+                cache = self._sentiment_cache
+                cache.pop(canon, None)  # re-insert so dict order tracks age; the oldest entry is first
+                while cache:
+                    oldest = next(iter(cache))
+                    # Drop expired entries, then the oldest fresh ones if still at the cap
+                    if now - cache[oldest][0] < self._sentiment_ttl and len(cache) < 256:
+                        break
+                    del cache[oldest]
+                cache[canon] = (now, results)
         return SentimentData(
             query=topic,
             sentiment_score=0.65,
@@ -2,8 +2,41 @@
 Yutori N1 Navigator — Internal routing and decision-making logic.
 Routes data from sources to the execution engine based on priority and context.
 """
+from bisect import bisect_right
+from types import MappingProxyType
+
+import orjson
+
 from app.integrations.base import BaseIntegration
-from typing import Dict, Any, List
+from typing import Dict, Any, Mapping, Tuple
+
+# Static routing tables, shared read-only across calls
+_ROUTING_MAP: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "market_data": MappingProxyType({"destination": "neo4j", "priority": "high", "pipeline": "analysis"}),
+    "sentiment": MappingProxyType({"destination": "fastino", "priority": "medium", "pipeline": "prediction"}),
+    "visual_pattern": MappingProxyType({"destination": "neo4j", "priority": "high", "pipeline": "correlation"}),
+    "economic_indicator": MappingProxyType({"destination": "neo4j", "priority": "low", "pipeline": "enrichment"}),
+    "trade_result": MappingProxyType({"destination": "numeric", "priority": "high", "pipeline": "accounting"}),
+})
+_DEFAULT_ROUTE: Mapping[str, str] = MappingProxyType({"destination": "neo4j", "priority": "low", "pipeline": "default"})
+
+_NAV_PLANS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "ingest": ("fetch_robinhood", "fetch_airbyte", "fetch_tavily"),
+    "analyze": ("reka_vision", "neo4j_correlations", "yutori_routing"),
+    "predict": ("fastino_score", "senso_context_update"),
+    "execute": ("robinhood_trade", "numeric_log"),
+    "learn": ("numeric_pnl", "neo4j_update", "fastino_feedback"),
+})
+_UNKNOWN_PLAN: Tuple[str, ...] = ("unknown_step",)
+
+# Score cut-offs and the decision for each band between them (lower bound inclusive)
+_DECISION_THRESHOLDS = (0.5, 0.75, 0.95)
+_DECISIONS: Tuple[Mapping[str, str], ...] = (
+    MappingProxyType({"action": "skip", "urgency": "low", "reason": "Below threshold"}),
+    MappingProxyType({"action": "monitor", "urgency": "medium", "reason": "Moderate signal"}),
+    MappingProxyType({"action": "execute", "urgency": "high", "reason": "Strong opportunity"}),
+    MappingProxyType({"action": "execute_and_alert", "urgency": "critical", "reason": "Anomaly detected"}),
+)
 
 
 class YutoriClient(BaseIntegration):
@@ -23,42 +56,24 @@ class YutoriClient(BaseIntegration):
         return True
 
     async def health_check(self) -> dict:
-        return {"name": self.name, "status": "healthy", "mode": "mock" if not self.api_key else "live"}
+        return {**self._health_template, "mode": "mock" if not self.api_key else "live"}
 
     async def shutdown(self) -> None:
         pass
 
     async def route_data(self, data_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Route data to the appropriate processing pipeline."""
-        routing_map = {
-            "market_data": {"destination": "neo4j", "priority": "high", "pipeline": "analysis"},
-            "sentiment": {"destination": "fastino", "priority": "medium", "pipeline": "prediction"},
-            "visual_pattern": {"destination": "neo4j", "priority": "high", "pipeline": "correlation"},
-            "economic_indicator": {"destination": "neo4j", "priority": "low", "pipeline": "enrichment"},
-            "trade_result": {"destination": "numeric", "priority": "high", "pipeline": "accounting"},
-        }
-        route = routing_map.get(data_type, {"destination": "neo4j", "priority": "low", "pipeline": "default"})
-        return {**route, "data_type": data_type, "status": "routed", "payload_size": len(str(payload))}
+        route = _ROUTING_MAP.get(data_type, _DEFAULT_ROUTE)
+        # Serialized size; orjson avoids building a repr() of the whole payload
+        payload_size = len(orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS))
+        return {**route, "data_type": data_type, "status": "routed", "payload_size": payload_size}
 
     async def make_decision(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Make a routing decision based on current context."""
-        score = context.get("predicted_score", 0)
-        if score >= 0.95:
-            return {"action": "execute_and_alert", "urgency": "critical", "reason": "Anomaly detected"}
-        elif score >= 0.75:
-            return {"action": "execute", "urgency": "high", "reason": "Strong opportunity"}
-        elif score >= 0.5:
-            return {"action": "monitor", "urgency": "medium", "reason": "Moderate signal"}
-        else:
-            return {"action": "skip", "urgency": "low", "reason": "Below threshold"}
+        decision = _DECISIONS[bisect_right(_DECISION_THRESHOLDS, context.get("predicted_score", 0))]
+        # Decisions end up in cycle logs, so hand back a plain (serializable, caller-owned) dict
+        return dict(decision)
 
-    async def get_navigation_plan(self, workflow_step: str) -> List[str]:
+    async def get_navigation_plan(self, workflow_step: str) -> Tuple[str, ...]:
         """Get the next steps in the navigation plan."""
-        plans = {
-            "ingest": ["fetch_robinhood", "fetch_airbyte", "fetch_tavily"],
-            "analyze": ["reka_vision", "neo4j_correlations", "yutori_routing"],
-            "predict": ["fastino_score", "senso_context_update"],
-            "execute": ["robinhood_trade", "numeric_log"],
-            "learn": ["numeric_pnl", "neo4j_update", "fastino_feedback"],
-        }
-        return plans.get(workflow_step, ["unknown_step"])
+        return _NAV_PLANS.get(workflow_step, _UNKNOWN_PLAN)
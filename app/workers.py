@@ -0,0 +1,10 @@
+"""
+Gunicorn worker class for the container (see gunicorn.conf.py).
+Pins uvloop/httptools instead of uvicorn's "auto", so a missing uvloop fails at boot
+rather than silently falling back to the asyncio loop.
+"""
+from uvicorn.workers import UvicornWorker
+
+
+class UvloopWorker(UvicornWorker):
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools"}
@@ -0,0 +1,15 @@
+"""
+Gunicorn settings for the container (loaded automatically from the working directory).
+Preforked uvicorn workers pinned to uvloop, with the app imported once in the master.
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+worker_class = "app.workers.UvloopWorker"
+# Import app.main once in the master and fork, so workers share its code pages copy-on-write.
+# Each worker's lifespan still builds its own orchestrator (and log listener) after the fork.
+preload_app = True
+# The orchestrator, its agent loop and its state are per process: N workers means N independent
+# agents and dashboards that disagree depending on which worker answers. Keep a single worker
+# unless the agent loop is moved out of the web process.
+workers = int(os.environ.get("WEB_CONCURRENCY", "1"))